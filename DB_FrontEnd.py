@@ -1,13 +1,41 @@
 # import dependencies
 import tkinter
 import tkinter.messagebox
+from tkinter import ttk
 import customtkinter
 import sqlite3
+import logging
+import queue
+import re
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
 
 #design page
 customtkinter.set_appearance_mode("Light")  # Modes: "System" (standard), "Dark", "Light"
 customtkinter.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
+# rows per multi-VALUES insert, keeps each statement under SQLite's 999 bound-parameter limit
+MAX_ROWS_PER_INSERT = 300
+
+# number of distinct (sql, params) results kept by App.query
+QUERY_CACHE_SIZE = 128
+
+# one "ProdID-qty" pair of the restock order field (a space between id and qty is accepted too),
+# and the whole field: one or more such pairs and nothing else
+ORDER_PAIR = re.compile(r'(\d+)[\s-]+(\d+)')
+ORDER_FIELD = re.compile(r'\s*\d+[\s-]+\d+(\s+\d+[\s-]+\d+)*\s*')
+
+# visible rows of a result table, longer results scroll
+TABLE_ROWS = 20
+
+# grid row of the "Order Restock" button under the low-stock table (the order form goes below it)
+ORDER_ROW = 5
+
+# how often (ms) the Tk loop checks for finished database jobs while any are outstanding
+POLL_MS = 20
+
 #Frame's class definition
 class MyFrame(customtkinter.CTkFrame):
     def __init__(self, master, **kwargs):
@@ -28,6 +56,46 @@ class App(customtkinter.CTk):
         # Setting branch id in app for each branch [change if app is running in different branch locaation]
         self.branch = 50504
 
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # one Tcl variable for every confirmation message, handlers just .set() it
+        # (the fixed form captions use plain text= and need no variable at all)
+        self._confirm_var = tkinter.StringVar(value="")
+
+        # read results keyed by (sql, params, versions of the tables read, PRAGMA data_version); a write
+        # here bumps the version of the tables it touches, so only results that read those tables go stale,
+        # and a commit by any other program using the database changes data_version and misses every entry
+        self._query_cache = OrderedDict()
+        self._table_ver = {"Product_Details": 0, "Branch_Request": 0}
+
+        # result tables are kept (one Treeview and its scrollbar per column layout) and refilled rather than rebuilt
+        self._table_pool = {}
+
+        # every query the handlers run, built once so only bind + execute happens per click
+        self._sql = {
+            'add_qty': "UPDATE Product_Details SET Quantity = Quantity + ? WHERE ProductName = ? RETURNING Quantity - ?, Quantity",
+            'view_products': "SELECT * from Product_Details",
+            'search_products': "SELECT * FROM Product_Details WHERE productname like ?",
+            'low_stock': "SELECT * FROM Product_Details WHERE Quantity < ?",
+            'insert_requests': "insert into Branch_Request (ProductID, BranchID, RequestedQty) values ",
+            'view_requests': "select * from Branch_Request",
+            'delete_request': "delete from Branch_Request where ProductID = (select ProductID from Product_Details where ProductName = ?) and RequestedQty - ? <= 0",
+            'update_request': "update Branch_Request set RequestedQty = RequestedQty - ? where ProductID = (select ProductID from Product_Details where ProductName = ?) and RequestedQty - ? > 0",
+        }
+
+        # the database connection lives on a worker thread so queries never block the Tk loop;
+        # handlers queue jobs with run_db() and _poll_results() hands the results back
+        self._db_q = queue.Queue()
+        self._results = queue.Queue()
+        self._page = 0 # bumped on navigation and on each search submit, results for an older page are dropped
+        # jobs queued but not yet handed back; the poll only runs while this is non-zero
+        # (the worker's connection setup counts as the first job)
+        self._pending = 1
+        self._poll_id = None
+        self._db_thread = threading.Thread(target=self._db_worker, daemon=True)
+        self._db_thread.start()
+        self._schedule_poll()
+
         # configure window
         self.title("Retailer Page")
         self.geometry(f"{1200}x{700}")
@@ -88,8 +156,108 @@ class App(customtkinter.CTk):
 
 
 
+    def _on_close(self):
+        if self._poll_id is not None:
+            self.after_cancel(self._poll_id)
+        self._db_q.put(None)
+        self._db_thread.join()
+        self.destroy()
+
+
+
+    # database thread: owns the single long-lived connection and runs queued jobs in order
+    def _db_worker(self):
+        # if the database cannot be opened, the loop keeps running and fails every job
+        # with that error, so each click still reports it instead of silently doing nothing
+        startup_error = None
+        self.conn = None
+        try:
+            self.conn = sqlite3.connect('./BackEnd/RetailerDB', isolation_level=None, cached_statements=256)
+            # per-connection settings, these never take a lock on the file
+            self.conn.executescript("PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY; PRAGMA mmap_size=268435456; PRAGMA cache_size=-20000;")
+        except sqlite3.Error as error:
+            startup_error = error
+            self._results.put((None, self._raise, error))
+        else:
+            # WAL and indexes are best effort: they need the write lock, and another program
+            # holding it must not break this session, the jobs still work without them
+            try:
+                self.conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.Error as error:
+                logger.warning("WAL mode skipped: %s", error)
+            try:
+                self._ensure_indexes()
+            except sqlite3.Error as error:
+                logger.warning("index setup skipped: %s", error)
+            self._results.put((None, lambda result: None, None))
+
+        while True:
+            job = self._db_q.get()
+            if job is None:
+                break
+            page, func, args, callback = job
+            try:
+                if startup_error is not None:
+                    raise startup_error
+                self._results.put((page, callback, func(*args)))
+            except Exception as error:
+                self._results.put((None, self._raise, error))
+
+        if self.conn is not None:
+            self.conn.close()
+
+
+
+    # queue func(*args) on the database thread, callback(result) then runs on the Tk loop
+    def run_db(self, func, args, callback):
+        self._pending += 1
+        self._db_q.put((self._page, func, args, callback))
+        self._schedule_poll()
+
+
+
+    def _schedule_poll(self):
+        if self._poll_id is None:
+            self._poll_id = self.after(POLL_MS, self._poll_results)
+
+
+
+    def _poll_results(self):
+        self._poll_id = None
+        try:
+            while not self._results.empty():
+                page, callback, result = self._results.get()
+                self._pending -= 1
+                if page is None or page == self._page:
+                    callback(result)
+        finally:
+            if self._pending:
+                self._schedule_poll()
+
+
+
+    # re-raise database errors on the Tk loop so they are reported like any other callback error
+    def _raise(self, error):
+        raise error
+
+
+
+    # Branch_Request(ProductID) is already covered by its (ProductID, BranchID) primary key;
+    # ANALYZE writes the whole database, so it only runs the first time the indexes are built
+    def _ensure_indexes(self):
+        if self.conn.execute("SELECT 1 FROM sqlite_master WHERE type='index' AND name='idx_pd_name'").fetchone():
+            return
+        self.conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_pd_name ON Product_Details(ProductName);
+            CREATE INDEX IF NOT EXISTS idx_pd_qty ON Product_Details(Quantity);
+            ANALYZE;
+        """)
+
+
+
     #sidebar button functions
     def UpdateDB(self):
+        self._page += 1
         self.clear_frame()
         self.controller_button = customtkinter.CTkButton(self.my_frame, command=self.getdetails_UpdateDB, text="New Entry")
         self.controller_button.grid(row=0, column=1, padx=20, pady=20)
@@ -97,6 +265,7 @@ class App(customtkinter.CTk):
 
 
     def CheckDB(self):
+        self._page += 1
         self.clear_frame()
         self.streaming_button = customtkinter.CTkButton(self.my_frame, command=self.viewtable, text="Check Database")
         self.streaming_button.grid(row=0, column=1, padx=20, pady=20)
@@ -104,6 +273,7 @@ class App(customtkinter.CTk):
 
 
     def SearchDB(self):
+        self._page += 1
         self.clear_frame()
         self.communication_button = customtkinter.CTkButton(self.my_frame, command=self.getdetails_SearchDB, text="Search New Entry")
         self.communication_button.grid(row=0, column=1, padx=20, pady=20)
@@ -111,6 +281,7 @@ class App(customtkinter.CTk):
 
 
     def DBRestockQuery(self):
+        self._page += 1
         self.clear_frame()
         self.visualizer_button = customtkinter.CTkButton(self.my_frame, command=self.getdetails_RestockDB, text="Restock Query")
         self.visualizer_button.grid(row=0, column=1, padx=20, pady=20)
@@ -118,8 +289,62 @@ class App(customtkinter.CTk):
 
 
     def clear_frame(self):
+        pooled = {widget for table in self._table_pool.values() for widget in table}
         for widget in self.my_frame.winfo_children():
-            widget.destroy()
+            if widget in pooled:
+                widget.grid_forget()
+            else:
+                widget.destroy()
+
+
+
+    # cached read: repeated SELECTs are answered from memory until one of the tables in reads changes
+    # or another connection commits to the database
+    def query(self, sql, params=(), reads=()):
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        key = (sql, tuple(params), tuple(self._table_ver[table] for table in reads), data_version)
+        rows = self._query_cache.get(key)
+        if rows is None:
+            rows = self.conn.execute(sql, params).fetchall()
+            self._query_cache[key] = rows
+            if len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        else:
+            self._query_cache.move_to_end(key)
+        return rows
+
+
+
+    # render query results as one Treeview instead of one label widget per cell
+    def show_table(self, column_name, rows, grid_row):
+        columns = list(range(len(column_name)))
+        table = self._table_pool.get(tuple(column_name))
+        if table is None:
+            tree = ttk.Treeview(self.my_frame, columns=columns, show='headings')
+            for j, name in enumerate(column_name):
+                tree.heading(j, text=name, anchor='w')
+                tree.column(j, width=150, anchor='w')
+            scrollbar = ttk.Scrollbar(self.my_frame, orient='vertical', command=tree.yview)
+            tree.configure(yscrollcommand=scrollbar.set)
+            self._table_pool[tuple(column_name)] = (tree, scrollbar)
+        else:
+            tree, scrollbar = table
+        tree.configure(height=min(max(len(rows), 1), TABLE_ROWS))
+        # rows stay plain tuples (default row_factory), which Treeview takes as values directly;
+        # existing items are rewritten in place, only extra rows are inserted and surplus ones deleted
+        items = tree.get_children()
+        for item, row in zip(items, rows):
+            tree.item(item, values=row)
+        for row in rows[len(items):]:
+            tree.insert('', 'end', values=row)
+        if len(items) > len(rows):
+            tree.delete(*items[len(rows):])
+        tree.grid(row=grid_row, column=0, columnspan=len(columns), padx=(20, 0), sticky='ew')
+        if len(rows) > TABLE_ROWS:
+            scrollbar.grid(row=grid_row, column=len(columns), padx=(0, 20), sticky='ns')
+        else:
+            scrollbar.grid_forget()
+        return tree
 
 
     # TEMPORARY FUNCTION
@@ -131,15 +356,13 @@ class App(customtkinter.CTk):
     # main frame button functions
     def getdetails_UpdateDB(self):
         # product name input
-        self.text_var = tkinter.StringVar(value="Product Name :")
-        self.label_name = customtkinter.CTkLabel(self.my_frame, textvariable= self.text_var)
+        self.label_name = customtkinter.CTkLabel(self.my_frame, text="Product Name :")
         self.label_name.grid(row=1, column=1)
         self.entry_name = customtkinter.CTkEntry(self.my_frame, placeholder_text='Enter Product Name ', width=400)
         self.entry_name.grid(row=1, column=2)
 
         # new quantity input
-        self.text_var = tkinter.StringVar(value="Quantity Arrived :")
-        self.label_qty = customtkinter.CTkLabel(self.my_frame, textvariable= self.text_var)
+        self.label_qty = customtkinter.CTkLabel(self.my_frame, text="Quantity Arrived :")
         self.label_qty.grid(row=2, column=1)
         self.entry_qty = customtkinter.CTkEntry(self.my_frame, placeholder_text='Enter Quantity Arrived ', width=400)
         self.entry_qty.grid(row=2, column=2)
@@ -154,66 +377,55 @@ class App(customtkinter.CTk):
         self.pname = self.entry_name.get()
         self.pqty = self.entry_qty.get()
         self.pqty = int(self.pqty)
-        #print(type(self.pname), type(self.pqty))
 
-        self.updatetable(self.pname,self.pqty)
+        self.run_db(self.updatetable, (self.pname, self.pqty), self.show_update)
 
 
 #CODE FROM HERE
     def updatetable(self,prod_name, prod_qty):
-        conn = sqlite3.connect('./BackEnd/RetailerDB')
-
-        self.removerequest(prod_name, prod_qty)
-
-        sql = "SELECT Quantity FROM Product_Details WHERE ProductName = ?"
-        r_set = conn.execute(sql, [prod_name])
-
-        for val in r_set:
-            old_value = val
-        
-        new_value = old_value[0] + prod_qty
-        #print(old_value[0])
-        #print(new_value)
-
-        sql = "UPDATE Product_Details SET Quantity = ? WHERE ProductName = ?"
-        conn.execute(sql, [new_value, prod_name])
-
-        conn.commit()
+        # settling the request and adding the stock commit together, in one transaction
+        self._table_ver["Product_Details"] += 1
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.removerequest(prod_name, prod_qty)
+
+            # read, add and write back the quantity in one statement (RETURNING needs SQLite >= 3.35)
+            row = self.conn.execute(self._sql['add_qty'], [prod_qty, prod_name, prod_qty]).fetchone()
+            if row is None:
+                # no such product, leave the pending requests untouched as well
+                self.conn.rollback()
+                return prod_name, None
+            old_value, new_value = row
+        logger.debug("stock arrival %s: %s -> %s", prod_name, old_value, new_value)
+        # the name goes back with the result, a later click may have changed self.pname meanwhile
+        return prod_name, row
+
+
+
+    def show_update(self, values):
+        prod_name, row = values
+        if row is None:
+            tkinter.messagebox.showerror("No such product", "{} is not in the database".format(prod_name))
+            return
+        old_value, new_value = row
 
         #HERE
-        text = "Update {} --> old-value : {}    new-value: {}".format(self.pname, old_value[0], new_value)
-        self.text_var = tkinter.StringVar(value=text)
-        label_confirmation = customtkinter.CTkLabel(self.my_frame, textvariable= self.text_var)
+        text = "Update {} --> old-value : {}    new-value: {}".format(prod_name, old_value, new_value)
+        self._confirm_var.set(text)
+        label_confirmation = customtkinter.CTkLabel(self.my_frame, textvariable= self._confirm_var)
         label_confirmation.grid(row=4, column=2)
 
-        conn.close()
-
 
 
     def viewtable(self):
             column_name = ['Product ID', 'Product Name', 'Product Cost', 'Quantity']
 
-            conn = sqlite3.connect('./BackEnd/RetailerDB')
-
-            r_set=conn.execute('SELECT * from Product_Details')
-
-            for i in range (4):
-                e = customtkinter.CTkLabel(self.my_frame, width=50, text=column_name[i], anchor='w')
-                e.grid(row=1, column=i,padx=20)
-            i=0 # row value inside the loop 
-            for row in r_set: 
-                for j in range(len(row)):
-                    e = customtkinter.CTkLabel(self.my_frame, width=50,text=row[j],anchor='w') 
-                    e.grid(row=i+2, column=j,padx=20) 
-                i=i+1
-
-            conn.close()
+            self.run_db(self.query, (self._sql['view_products'], (), ("Product_Details",)), lambda rows: self.show_table(column_name, rows, 1))
 
 
 
     def getdetails_SearchDB(self):
-        self.text_var = tkinter.StringVar(value="Product Name :")
-        self.label_name = customtkinter.CTkLabel(self.my_frame, textvariable= self.text_var)
+        self.label_name = customtkinter.CTkLabel(self.my_frame, text="Product Name :")
         self.label_name.grid(row=1, column=1)
         self.entry_name = customtkinter.CTkEntry(self.my_frame, placeholder_text='partial / whole word', width=400)
         self.entry_name.grid(row=1, column=2)
@@ -224,40 +436,30 @@ class App(customtkinter.CTk):
 
 
     def retreive_SearchDB(self):
+        self._page += 1 # only the latest search may render
         self.pname = self.entry_name.get()
         self.searchprod(self.pname)
 
 
 
     def searchprod(self, prod_name):
-        conn = sqlite3.connect('./BackEnd/RetailerDB')
+        self.run_db(self.query, (self._sql['search_products'], ['%' + prod_name + '%'], ("Product_Details",)), self.show_search)
 
-        column_name = ['Product ID', 'Product Name', 'Product Cost', 'Quantity']
 
-        sql = " SELECT * FROM Product_Details WHERE productname like ?"
-        r_set = conn.execute(sql, ['%' + prod_name + '%'])
+
+    def show_search(self, rows):
+        column_name = ['Product ID', 'Product Name', 'Product Cost', 'Quantity']
 
         self.clear_frame()
 
         self.getdetails_SearchDB()
 
-        for i in range (4):
-            e = customtkinter.CTkLabel(self.my_frame, width=50, text=column_name[i], anchor='w')
-            e.grid(row=3, column=i,padx=20)
-        i=4 # row value inside the loop 
-        for row in r_set: 
-            for j in range(len(row)):
-                e = customtkinter.CTkLabel(self.my_frame, width=50,text=row[j],anchor='w') 
-                e.grid(row=i, column=j,padx=20) 
-            i=i+1
-
-        conn.close()
+        self.show_table(column_name, rows, 3)
 
 
 
     def getdetails_RestockDB(self):
-        self.text_var = tkinter.StringVar(value="Quantity Lower Limit")
-        self.label_name = customtkinter.CTkLabel(self.my_frame, textvariable= self.text_var)
+        self.label_name = customtkinter.CTkLabel(self.my_frame, text="Quantity Lower Limit")
         self.label_name.grid(row=1, column=1)
         self.entry_name = customtkinter.CTkEntry(self.my_frame, placeholder_text='Quantity below which products need to be displayed', width=400)
         self.entry_name.grid(row=1, column=2)
@@ -268,43 +470,35 @@ class App(customtkinter.CTk):
 
 
     def retreive_RestockDB(self):
+        self._page += 1 # only the latest stock check may render
         self.qty = self.entry_name.get()
         self.searchstock(self.qty)
 
 
 
     def searchstock(self, prod_qty):
-        conn = sqlite3.connect('./BackEnd/RetailerDB')
+        self.run_db(self.query, (self._sql['low_stock'], [prod_qty], ("Product_Details",)), self.show_stock)
 
-        column_name = ['Product ID', 'Product Name', 'Product Cost', 'Quantity']
 
-        sql = " SELECT * FROM Product_Details WHERE Quantity < ?"
-        r_set = conn.execute(sql, [prod_qty])
+
+    def show_stock(self, rows):
+        column_name = ['Product ID', 'Product Name', 'Product Cost', 'Quantity']
 
         self.clear_frame()
 
         self.getdetails_RestockDB()
 
-        for i in range (4):
-            e = customtkinter.CTkLabel(self.my_frame, width=50, text=column_name[i], anchor='w')
-            e.grid(row=3, column=i,padx=20)
-        i=4 # row value inside the loop 
-        for row in r_set: 
-            for j in range(len(row)):
-                e = customtkinter.CTkLabel(self.my_frame, width=50,text=row[j],anchor='w') 
-                e.grid(row=i, column=j,padx=20) 
-            i=i+1
+        self.show_table(column_name, rows, 3)
 
-        self.index = i+1
+        self.index = ORDER_ROW
 
         retreival_button5 = customtkinter.CTkButton(self.my_frame, command=self.getdetails_Restock, text="Order Restock")
-        retreival_button5.grid(row=i+1, column=1, padx=20, pady=20)
+        retreival_button5.grid(row=ORDER_ROW, column=1, padx=20, pady=20)
 
 
 
     def getdetails_Restock(self):
-        self.text_var = tkinter.StringVar(value="Product ID's : ")
-        self.label_name = customtkinter.CTkLabel(self.my_frame, textvariable= self.text_var)
+        self.label_name = customtkinter.CTkLabel(self.my_frame, text="Product ID's : ")
         self.label_name.grid(row=self.index+1, column=1)    
         self.entry_name = customtkinter.CTkEntry(self.my_frame, placeholder_text="ProdID1-qty1 ProdID2-qty2 ProdID3-qty3 ...(space btw each prodID-qty)", width=400)
         self.entry_name.grid(row=self.index+1, column=2)
@@ -317,87 +511,58 @@ class App(customtkinter.CTk):
     def retreive_OrderDetails(self):
         #self.getdetails_Restock()
         details = self.entry_name.get()
-        details = details.split(" ")
-        #print(details)
+        if ORDER_FIELD.fullmatch(details) is None:
+            tkinter.messagebox.showerror("Invalid order", "Enter the order as ProdID1-qty1 ProdID2-qty2 ...")
+            return
+        details = ORDER_PAIR.findall(details)
+        rows = [(int(prodid), self.branch, int(qty)) for prodid, qty in details]
+        logger.debug("restock order: %s", rows)
 
-        self.Order(details)
+        self.run_db(self.Order, (rows,), lambda result: self.show_order(self.index+3))
 
 
     #CHECKKKKKKKK
-    def Order(self, prod):
-        conn = sqlite3.connect('./BackEnd/RetailerDB')
+    def Order(self, rows):
+        # one explicit transaction for the whole order (the connection is in autocommit mode),
+        # sending the rows as multi-VALUES inserts instead of one statement per product
+        self._table_ver["Branch_Request"] += 1
+        with self.conn:
+            self.conn.execute("BEGIN")
+            for start in range(0, len(rows), MAX_ROWS_PER_INSERT):
+                chunk = rows[start:start + MAX_ROWS_PER_INSERT]
+                values = ",".join(["(?,?,?)"] * len(chunk))
+                self.conn.execute(self._sql['insert_requests'] + values, [value for row in chunk for value in row])
 
-        sql = "insert into Branch_Request (ProductID, BranchID, RequestedQty) values(?,?,?)"
-
-        for index in range(0, len(prod), 2):
-            print(index)
-            print(prod[index])
-            print(prod[index+1])
-            r_set = conn.execute(sql, [prod[index], self.branch, int(prod[index+1])])
-        
-        text = "Order Sent"
-        self.text_var = tkinter.StringVar(value=text)
-        label_confirmation = customtkinter.CTkLabel(self.my_frame, textvariable= self.text_var)
-        label_confirmation.grid(row=index+2, column=2)
 
-        conn.commit()
 
-        conn.close()
+    def show_order(self, grid_row):
+        text = "Order Sent"
+        self._confirm_var.set(text)
+        label_confirmation = customtkinter.CTkLabel(self.my_frame, textvariable= self._confirm_var)
+        label_confirmation.grid(row=grid_row, column=2)
 
 
 
     def RestockDetails(self):
+        self._page += 1
         self.clear_frame()
-        conn = sqlite3.connect('./BackEnd/RetailerDB')
-
         column_name = ['Product ID', 'Branch ID', "Requested Quantity"]
 
-        sql = "select * from Branch_Request"
-        r_set = conn.execute(sql)
-
-        for i in range (3):
-            e = customtkinter.CTkLabel(self.my_frame, width=50, text=column_name[i], anchor='w')
-            e.grid(row=1, column=i,padx=20)
-        i=2 # row value inside the loop 
-        for row in r_set: 
-            for j in range(len(row)):
-                e = customtkinter.CTkLabel(self.my_frame, width=50,text=row[j],anchor='w') 
-                e.grid(row=i, column=j,padx=20)
-            i=i+1
-
-        conn.close()
+        self.run_db(self.query, (self._sql['view_requests'], (), ("Branch_Request",)), lambda rows: self.show_table(column_name, rows, 1))
 
 
 
+    # runs inside updatetable's transaction
     def removerequest(self,name, qty):
-        conn = sqlite3.connect('./BackEnd/RetailerDB')
-
-        sql = "select ProductID from Product_Details where ProductName = ?"
-        r_set = conn.execute(sql, [name])
-        for row in r_set:
-            prodid = row[0]
-
-        sql = "select RequestedQty from Branch_Request where ProductID = ?"
-        r_set = conn.execute(sql, [prodid])
-        for row in r_set:
-            requestedqty = row[0]
-        
-        required = requestedqty - qty
-
-        if(required <= 0):
-            sql = "delete from Branch_Request where ProductID = ?"
-            r_set = conn.execute(sql, [prodid])
-        else:
-            sql = "update Branch_Request set RequestedQty = ? where ProductID = ?"
-            r_set = conn.execute(sql, [required, prodid])
-
-        conn.commit()
-
-        conn.close()
+        # settle the pending request in SQL: drop it once fully covered, otherwise reduce it
+        self._table_ver["Branch_Request"] += 1
+        self.conn.execute(self._sql['delete_request'], [name, qty])
+        self.conn.execute(self._sql['update_request'], [qty, name, qty])
         
         
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     app = App()
     app.mainloop()
\ No newline at end of file